@@ -12,11 +12,15 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
 import os
+import shutil
 import sys
-import subprocess
+from collections import ChainMap
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import BinaryIO, Dict, Any, List, Optional, Tuple
 
 try:
     import yaml
@@ -24,49 +28,97 @@ except ImportError:
     print("Error: PyYAML is required. Install with: pip3 install pyyaml")
     sys.exit(1)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    from jinja2 import Environment, FileSystemLoader
 except ImportError:
     print("Error: Jinja2 is required. Install with: pip3 install jinja2")
     sys.exit(1)
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # Optional: enables parsed-YAML snapshots (pip3 install msgpack)
+
+# Below this many nodes, process start-up costs more than rendering saves
+PARALLEL_MIN_NODES = 8
+
+
+def _quote(s: Any) -> str:
+    """Jinja2 filter: wrap a value in double quotes."""
+    return f'"{s}"'
+
+
+def _as_list(s: Any) -> List[Any]:
+    """Jinja2 filter: wrap a scalar in a list, pass lists through."""
+    return s if isinstance(s, list) else [s]
+
+
+def _timestamp() -> str:
+    """Generation timestamp, honouring SOURCE_DATE_EPOCH for reproducible builds."""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        try:
+            return datetime.fromtimestamp(int(epoch), timezone.utc).isoformat()
+        except (ValueError, OverflowError, OSError):
+            print(f"Warning: Ignoring invalid SOURCE_DATE_EPOCH: {epoch!r}")
+    return datetime.now(timezone.utc).isoformat()
+
 
 class PeeringManager:
     """Manages BGP peering configuration generation."""
 
-    def __init__(self, base_dir: Optional[Path] = None):
+    def __init__(self, base_dir: Optional[Path] = None, output_dir: Optional[Path] = None):
         """Initialize the peering manager.
 
         Args:
             base_dir: Base directory containing templates/ and data/
+            output_dir: Directory for generated output (default: base_dir/output)
         """
         self.base_dir = base_dir or Path(__file__).parent
         self.templates_dir = self.base_dir / "templates"
         self.data_dir = self.base_dir / "data"
-        self.output_dir = self.base_dir / "output"
+        self.peers_dir = self.data_dir / "peers"
+        self.nodes_dir = self.data_dir / "nodes"
+        self.output_dir = Path(output_dir) if output_dir else self.base_dir / "output"
+
+        # Parsed YAML keyed by path, invalidated on mtime change
+        self._yaml_cache: Dict[Path, Tuple[float, Dict[str, Any]]] = {}
 
         # Validate directory structure
         self._validate_directories()
 
+        # Index peer files once so per-peer lookups are a dict hit
+        self._peer_paths: Dict[str, Path] = {
+            name: self.peers_dir / f"{name}.yaml"
+            for name in self._list_yaml_stems(self.peers_dir)
+        }
+
         # Initialize Jinja2 environment
         self.env = Environment(
             loader=FileSystemLoader(str(self.templates_dir)),
-            autoescape=select_autoescape(['html', 'xml']),
+            autoescape=False,  # bird.conf is not HTML/XML
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=False,
         )
 
         # Add custom filters
-        self.env.filters['quote'] = lambda s: f'"{s}"'
-        self.env.filters['as_list'] = lambda s: s if isinstance(s, list) else [s]
+        self.env.filters['quote'] = _quote
+        self.env.filters['as_list'] = _as_list
+
+        # Compile the main template once; templates don't change mid-run
+        self._bird_template = self.env.get_template("bird.conf.j2")
 
     def _validate_directories(self) -> None:
         """Validate required directories exist."""
         required_dirs = [
             self.templates_dir,
             self.data_dir,
-            self.data_dir / "peers",
-            self.data_dir / "nodes",
+            self.peers_dir,
+            self.nodes_dir,
         ]
 
         for d in required_dirs:
@@ -79,14 +131,77 @@ class PeeringManager:
         Args:
             path: Path to YAML file
 
+        Returns:
+            Parsed YAML content as dictionary, shared with the parse cache
+            and so not to be mutated
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        st = path.stat()
+        cached = self._yaml_cache.get(path)
+        if cached is None or cached[0] != st.st_mtime:
+            cached = (st.st_mtime, self._parse_yaml(path, st))
+            self._yaml_cache[path] = cached
+
+        # No copy: overrides are layered on with ChainMap, nothing mutates this
+        return cached[1]
+
+    def _parse_yaml(self, path: Path, st: os.stat_result) -> Dict[str, Any]:
+        """Parse a YAML file, via its msgpack snapshot when one is current.
+
+        With msgpack installed, each parsed file is snapshotted to
+        <name>.yaml.mpk next to it and later runs unpack that instead of
+        re-parsing the YAML. A snapshot records the source's mtime_ns and
+        size and is only used when both match exactly, so edits that keep
+        or rewind the mtime (cp -p, rsync -t, restores) still invalidate it
+        unless they also preserve the size.
+
+        Args:
+            path: Path to YAML file
+            st: stat() result of the YAML file
+
         Returns:
             Parsed YAML content as dictionary
         """
-        if not path.exists():
-            raise FileNotFoundError(f"YAML file not found: {path}")
+        # Hand libyaml raw bytes so decoding happens in C, not a TextIOWrapper
+        if msgpack is None:
+            return yaml.load(path.read_bytes(), Loader=Loader) or {}
 
-        with open(path, 'r') as f:
-            return yaml.safe_load(f) or {}
+        source = [st.st_mtime_ns, st.st_size]
+        snapshot = path.with_name(path.name + ".mpk")
+        try:
+            mtime_ns, size, data = msgpack.unpackb(
+                snapshot.read_bytes(), raw=False, strict_map_key=False
+            )
+            if [mtime_ns, size] == source:
+                return data
+        except (OSError, ValueError, TypeError):
+            pass  # Missing, corrupt or old-format snapshot, or msgpack < 1.0
+
+        data = yaml.load(path.read_bytes(), Loader=Loader) or {}
+
+        # Unique temp name: worker processes may parse the same peer at once
+        import tempfile
+
+        # A snapshot is only an optimisation: any failure just means none
+        tmp_path = None
+        try:
+            packed = msgpack.packb(source + [data], use_bin_type=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=snapshot.name + ".", suffix=".tmp"
+            )
+            with os.fdopen(fd, 'wb') as f:
+                f.write(packed)
+            os.replace(tmp_path, snapshot)
+            tmp_path = None
+        except (OSError, TypeError, ValueError, OverflowError):
+            pass  # Read-only data dir, or values msgpack can't encode (dates, huge ints)
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+        return data
 
     def load_global_config(self) -> Dict[str, Any]:
         """Load global configuration.
@@ -111,7 +226,9 @@ class PeeringManager:
         Returns:
             Peer configuration dictionary
         """
-        peer_path = self.data_dir / "peers" / f"{peer_name}.yaml"
+        peer_path = self._peer_paths.get(peer_name)
+        if peer_path is None:
+            raise FileNotFoundError(f"Peer configuration not found: {peer_name}")
         return self.load_yaml(peer_path)
 
     def load_node(self, node_name: str) -> Dict[str, Any]:
@@ -123,7 +240,7 @@ class PeeringManager:
         Returns:
             Node configuration dictionary
         """
-        node_path = self.data_dir / "nodes" / f"{node_name}.yaml"
+        node_path = self.nodes_dir / f"{node_name}.yaml"
         return self.load_yaml(node_path)
 
     def list_nodes(self) -> List[str]:
@@ -132,8 +249,7 @@ class PeeringManager:
         Returns:
             List of node names
         """
-        nodes_dir = self.data_dir / "nodes"
-        return [f.stem for f in nodes_dir.glob("*.yaml")]
+        return self._list_yaml_stems(self.nodes_dir)
 
     def list_peers(self) -> List[str]:
         """List all available peer configurations.
@@ -141,14 +257,35 @@ class PeeringManager:
         Returns:
             List of peer names
         """
-        peers_dir = self.data_dir / "peers"
-        return [f.stem for f in peers_dir.glob("*.yaml")]
+        return self._list_yaml_stems(self.peers_dir)
+
+    @staticmethod
+    def _list_yaml_stems(directory: Path) -> List[str]:
+        """List names of the .yaml files in a directory.
+
+        Uses os.scandir so file type comes from the directory listing
+        itself rather than a stat() per entry.
+
+        Args:
+            directory: Directory to scan
 
-    def build_context(self, node_name: str) -> Dict[str, Any]:
+        Returns:
+            List of filenames without the .yaml suffix
+        """
+        with os.scandir(directory) as it:
+            return [
+                e.name[:-5] for e in it
+                if e.name.endswith(".yaml") and e.is_file()
+            ]
+
+    def build_context(
+        self, node_name: str, generated_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Build the template rendering context for a node.
 
         Args:
             node_name: Name of the node
+            generated_at: Timestamp to stamp the config with (default: now)
 
         Returns:
             Context dictionary for template rendering
@@ -162,18 +299,22 @@ class PeeringManager:
         peers = []
 
         for peer_name in peer_names:
-            try:
-                peer = self.load_peer(peer_name)
+            peer_path = self._peer_paths.get(peer_name)
+            if peer_path is None:
+                print(f"Warning: Peer configuration not found: {peer_name}")
+                continue
 
-                # Apply node-specific overrides
-                overrides = node_config.get('overrides', {}).get(peer_name, {})
-                peer.update(overrides)
+            peer = self.load_yaml(peer_path)
 
-                # Only include enabled peers
-                if peer.get('enabled', True):
-                    peers.append(peer)
-            except FileNotFoundError:
-                print(f"Warning: Peer configuration not found: {peer_name}")
+            # Apply node-specific overrides as a layered view rather than a
+            # merged copy; templates only read from it
+            overrides = node_config.get('overrides', {}).get(peer_name, {})
+            if overrides:
+                peer = ChainMap(overrides, peer)
+
+            # Only include enabled peers
+            if peer.get('enabled', True):
+                peers.append(peer)
 
         # Build context
         context = {
@@ -181,77 +322,288 @@ class PeeringManager:
             'node': node_config,
             'peers': peers,
             'generated_by': 'AEGIS Peering Manager',
-            'generated_at': __import__('datetime').datetime.now(__import__('datetime').timezone.utc).isoformat(),
+            'generated_at': generated_at or _timestamp(),
         }
 
         return context
 
-    def render_config(self, node_name: str) -> str:
+    def render_config(self, node_name: str, generated_at: Optional[str] = None) -> str:
         """Render the BIRD configuration for a node.
 
         Args:
             node_name: Name of the node
+            generated_at: Timestamp to stamp the config with (default: now)
 
         Returns:
             Rendered BIRD configuration string
         """
-        context = self.build_context(node_name)
-        template = self.env.get_template("bird.conf.j2")
-        return template.render(**context)
+        context = self.build_context(node_name, generated_at)
+        return self._bird_template.render(**context)
+
+    def render_to(
+        self, node_name: str, file: BinaryIO, generated_at: Optional[str] = None
+    ) -> None:
+        """Render the BIRD configuration for a node straight into a file.
 
-    def generate(self, node_name: str, output_path: Optional[Path] = None) -> str:
+        Template output is written fragment by fragment, so the full
+        configuration is never held in memory as one string.
+
+        Args:
+            node_name: Name of the node
+            file: Binary file object to write UTF-8 output to
+            generated_at: Timestamp to stamp the config with (default: now)
+        """
+        context = self.build_context(node_name, generated_at)
+        self._bird_template.stream(**context).dump(file, encoding='utf-8')
+
+    def generate(
+        self,
+        node_name: str,
+        output_path: Optional[Path] = None,
+        generated_at: Optional[str] = None,
+        return_config: bool = True,
+    ) -> Optional[str]:
         """Generate BIRD configuration for a node.
 
+        When output_path is given and no generated_at is passed, a cached
+        render is reused if no input has changed; it keeps the timestamp of
+        the run that rendered it.
+
         Args:
             node_name: Name of the node
             output_path: Optional path to write configuration
+            generated_at: Timestamp to stamp the config with (default: now).
+                Passing one bypasses the render cache, so the result always
+                carries it.
+            return_config: With output_path, set False to stream the render
+                into the file without building the config as one string
 
         Returns:
-            Rendered configuration string
+            Rendered configuration string, or None if return_config is False
+            and output_path is given
         """
-        config = self.render_config(node_name)
-
+        config = self._generate(
+            node_name, output_path, generated_at, use_cache=generated_at is None,
+            return_config=return_config,
+        )
         if output_path:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                f.write(config)
             print(f"Generated: {output_path}")
-
         return config
 
+    def _generate(
+        self,
+        node_name: str,
+        output_path: Optional[Path],
+        generated_at: Optional[str],
+        use_cache: bool,
+        digest: Optional[str] = None,
+        return_config: bool = True,
+    ) -> Optional[str]:
+        """Generate BIRD configuration for a node, optionally via the render cache.
+
+        Unlike generate() this prints nothing, so pool workers don't
+        interleave output; callers report the written path themselves.
+
+        Args:
+            node_name: Name of the node
+            output_path: Optional path to write configuration
+            generated_at: Timestamp to stamp fresh renders with (default: now)
+            use_cache: Reuse a cached render whose inputs are unchanged
+            digest: Precomputed input digest, so batches hash inputs once
+            return_config: With output_path, set False to stream the render
+                into the file and return None
+
+        Returns:
+            Rendered configuration string, or None if not requested
+        """
+        if not output_path:
+            return self.render_config(node_name, generated_at)
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Reuse the last render when no input file has changed since
+        digest = digest or self._input_digest()
+        data = self._read_render_cache(node_name, digest) if use_cache else None
+        if data is not None:
+            self._write_atomic(output_path, data)
+            return data.decode('utf-8') if return_config else None
+
+        if return_config:
+            data = self.render_config(node_name, generated_at).encode('utf-8')
+            self._write_atomic(output_path, data)
+        else:
+            # Nothing needs the text, so stream the render into the file
+            tmp_path = output_path.with_name(output_path.name + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                self.render_to(node_name, f, generated_at)
+            os.replace(tmp_path, output_path)
+
+        self._write_render_cache(node_name, digest, output_path)
+        return data.decode('utf-8') if return_config else None
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write a file via a sibling temp file and rename.
+
+        A crash never leaves a truncated file behind at path.
+
+        Args:
+            path: Destination file
+            data: File contents
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb', buffering=0) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _input_digest(self) -> str:
+        """Fingerprint every input that affects rendered output.
+
+        Covers all YAML under data/, every template (bird.conf.j2 pulls in
+        the others via include) and this script, using
+        (path, mtime, size) so no file contents need to be read, plus
+        SOURCE_DATE_EPOCH since it fixes the stamped timestamp.
+
+        Returns:
+            Hex digest of the inputs
+        """
+        inputs = sorted(self.data_dir.rglob("*.yaml"))
+        inputs += sorted(self.templates_dir.rglob("*.j2"))
+        inputs.append(Path(__file__))
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(os.environ.get('SOURCE_DATE_EPOCH', '').encode() + b"\n")
+        for path in inputs:
+            st = path.stat()
+            h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        return h.hexdigest()
+
+    def _read_render_cache(self, node_name: str, digest: str) -> Optional[bytes]:
+        """Return a node's cached render if it matches the current inputs.
+
+        Args:
+            node_name: Name of the node
+            digest: Current input digest
+
+        Returns:
+            Cached UTF-8 configuration, or None on a miss
+        """
+        cache_dir = self.output_dir / ".cache"
+        try:
+            if (cache_dir / f"{node_name}.hash").read_text() != digest:
+                return None
+            return (cache_dir / f"{node_name}.conf").read_bytes()
+        except (OSError, ValueError):
+            return None  # Missing, unreadable or not a directory: a miss
+
+    def _write_render_cache(self, node_name: str, digest: str, source: Path) -> None:
+        """Store a node's render alongside the input digest it came from.
+
+        The cache is best-effort: if it can't be written, generation
+        carries on without it.
+
+        Args:
+            node_name: Name of the node
+            digest: Input digest the config was rendered from
+            source: Freshly written config file to copy into the cache
+        """
+        cache_dir = self.output_dir / ".cache"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Config first: the hash file marks the entry as complete
+            conf_path = cache_dir / f"{node_name}.conf"
+            tmp_path = conf_path.with_name(conf_path.name + ".tmp")
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, conf_path)
+            self._write_atomic(cache_dir / f"{node_name}.hash", digest.encode())
+        except OSError:
+            pass
+
     def generate_all(self, output_dir: Optional[Path] = None) -> Dict[str, str]:
         """Generate configurations for all nodes.
 
+        Nodes are rendered in worker processes, one PeeringManager per
+        worker, when there are at least PARALLEL_MIN_NODES of them and more
+        than one CPU; otherwise they are rendered in this process.
+
         Args:
-            output_dir: Directory to write configurations
+            output_dir: Directory to write configurations; becomes this
+                manager's output_dir, so the render cache lives under it
 
         Returns:
             Dictionary mapping node names to configurations
         """
-        output_dir = Path(output_dir) if output_dir else self.output_dir
+        if output_dir:
+            self.output_dir = Path(output_dir)
+        output_dir = self.output_dir
+        node_names = self.list_nodes()
         configs = {}
 
-        for node_name in self.list_nodes():
-            try:
-                output_path = output_dir / node_name / "bird.conf"
-                configs[node_name] = self.generate(node_name, output_path)
-            except Exception as e:
-                print(f"Error generating config for {node_name}: {e}")
-
-        return configs
+        # One timestamp for everything rendered in this batch; nodes served
+        # from the render cache keep the timestamp of their original render
+        generated_at = _timestamp()
+        digest = self._input_digest()
 
-    def validate_config(self, config: str) -> bool:
+        workers = min(os.cpu_count() or 1, len(node_names))
+        if workers < 2 or len(node_names) < PARALLEL_MIN_NODES:
+            for node_name in node_names:
+                output_path = output_dir / node_name / "bird.conf"
+                try:
+                    configs[node_name] = self._generate(
+                        node_name, output_path, generated_at, use_cache=True,
+                        digest=digest,
+                    )
+                    print(f"Generated: {output_path}")
+                except Exception as e:
+                    print(f"Error generating config for {node_name}: {e}")
+            return configs
+
+        # Only fleets big enough for the pool pay for importing multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.base_dir, output_dir),
+        ) as ex:
+            futures = {
+                ex.submit(_render_one, node_name, generated_at, digest): node_name
+                for node_name in node_names
+            }
+            for fut in as_completed(futures):
+                node_name = futures[fut]
+                try:
+                    configs[node_name] = fut.result()
+                    print(f"Generated: {output_dir / node_name / 'bird.conf'}")
+                except Exception as e:
+                    print(f"Error generating config for {node_name}: {e}")
+
+        # Keep results in node listing order regardless of completion order
+        return {n: configs[n] for n in node_names if n in configs}
+
+    def validate_config(self, config: str, node_name: Optional[str] = None) -> bool:
         """Validate a BIRD configuration using bird -p.
 
         Args:
             config: Configuration string to validate
+            node_name: Optional node name; when given, a config identical to
+                the node's last successfully validated one (ignoring the
+                Generated at line) is not rechecked
 
         Returns:
             True if valid, False otherwise
         """
+        import subprocess
         import tempfile
 
+        digest = self._config_digest(config)
+        validated = self._load_validated() if node_name else {}
+        if node_name and validated.get(node_name) == digest:
+            print("Configuration unchanged since last successful validation")
+            return True
+
         # Write config to temp file
         with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
             f.write(config)
@@ -268,6 +620,9 @@ class PeeringManager:
 
             if result.returncode == 0:
                 print("Configuration is valid")
+                if node_name:
+                    validated[node_name] = digest
+                    self._store_validated(validated)
                 return True
             else:
                 print(f"Configuration validation failed:\n{result.stderr}")
@@ -283,6 +638,181 @@ class PeeringManager:
         finally:
             os.unlink(temp_path)
 
+    def validate_configs(self, configs: Dict[str, str]) -> Dict[str, bool]:
+        """Validate several BIRD configurations with concurrent bird -p runs.
+
+        All configs are written into one temporary directory and checked
+        with up to os.cpu_count() bird processes at a time. Configs
+        identical to a node's last successfully validated one (ignoring the
+        Generated at line) are skipped.
+
+        Args:
+            configs: Dictionary mapping node names to configurations
+
+        Returns:
+            Dictionary mapping node names to validation results
+        """
+        import asyncio
+        import tempfile
+
+        async def check(path: Path, limit: asyncio.Semaphore) -> Tuple[str, str]:
+            async with limit:
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        'bird', '-p', '-c', str(path),
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
+                except FileNotFoundError:
+                    return 'missing', ''
+                try:
+                    _, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    return 'timeout', ''
+                status = 'valid' if proc.returncode == 0 else 'invalid'
+                return status, stderr.decode(errors='replace')
+
+        async def check_all(paths: List[Path]) -> List[Tuple[str, str]]:
+            limit = asyncio.Semaphore(os.cpu_count() or 1)
+            return await asyncio.gather(*(check(p, limit) for p in paths))
+
+        digests = {
+            node_name: self._config_digest(config)
+            for node_name, config in configs.items()
+        }
+        validated = self._load_validated()
+        pending = [n for n in configs if validated.get(n) != digests[n]]
+
+        outcomes = {}
+        if pending:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                paths = []
+                for node_name in pending:
+                    path = Path(temp_dir) / f"{node_name}.conf"
+                    path.write_text(configs[node_name])
+                    paths.append(path)
+
+                outcomes = dict(zip(pending, asyncio.run(check_all(paths))))
+
+        if any(status == 'missing' for status, _ in outcomes.values()):
+            print("Warning: BIRD not installed, skipping validation")
+            print("Install BIRD to enable config validation: apt install bird2")
+            return {node_name: True for node_name in configs}  # Assume valid if bird not available
+
+        results = {}
+        for node_name in configs:
+            print(f"\nValidating {node_name}:")
+            if node_name not in outcomes:
+                print("Configuration unchanged since last successful validation")
+                results[node_name] = True
+                continue
+
+            status, stderr = outcomes[node_name]
+            if status == 'valid':
+                print("Configuration is valid")
+                validated[node_name] = digests[node_name]
+            elif status == 'invalid':
+                print(f"Configuration validation failed:\n{stderr}")
+            else:
+                print("Warning: BIRD validation timed out")
+            results[node_name] = status == 'valid'
+
+        if outcomes:
+            self._store_validated(validated)
+
+        return results
+
+    @staticmethod
+    def _config_digest(config: str) -> str:
+        """Hash a rendered config for the validation record.
+
+        The Generated at line is left out so a re-render of unchanged
+        inputs, which only differs in its timestamp, still matches.
+
+        Args:
+            config: Rendered configuration string
+
+        Returns:
+            SHA-256 hex digest
+        """
+        h = hashlib.sha256()
+        for line in config.splitlines(keepends=True):
+            if not line.startswith('# Generated at:'):
+                h.update(line.encode())
+        return h.hexdigest()
+
+    def _load_validated(self) -> Dict[str, str]:
+        """Load the node -> config hash record of successful validations.
+
+        The record lives at output_dir/.validated.json, next to the
+        configs generate_all writes.
+
+        Returns:
+            Dictionary mapping node names to SHA-256 hex digests
+        """
+        try:
+            validated = json.loads((self.output_dir / ".validated.json").read_text())
+        except (OSError, ValueError):
+            return {}
+        return validated if isinstance(validated, dict) else {}
+
+    def _store_validated(self, validated: Dict[str, str]) -> None:
+        """Persist the node -> config hash record of successful validations.
+
+        The record is only an optimisation, so failing to write it is not
+        an error; the next run simply validates again.
+
+        Args:
+            validated: Dictionary mapping node names to SHA-256 hex digests
+        """
+        path = self.output_dir / ".validated.json"
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(validated, indent=2, sort_keys=True))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+# Per-process manager for generate_all workers, set up by _init_worker
+_worker_manager: Optional[PeeringManager] = None
+
+
+def _init_worker(base_dir: Path, output_dir: Path) -> None:
+    """Create the PeeringManager a generate_all worker reuses for every node.
+
+    Keeping one manager per worker shares its compiled template, peer
+    index and YAML cache across all the nodes that worker renders.
+
+    Args:
+        base_dir: Base directory containing templates/ and data/
+        output_dir: Directory to write configurations
+    """
+    global _worker_manager
+    _worker_manager = PeeringManager(base_dir, output_dir)
+
+
+def _render_one(
+    node_name: str, generated_at: Optional[str] = None, digest: Optional[str] = None
+) -> str:
+    """Generate one node's configuration in a worker process.
+
+    Args:
+        node_name: Name of the node
+        generated_at: Timestamp to stamp fresh renders with (default: now)
+        digest: Input digest computed once by generate_all
+
+    Returns:
+        Rendered configuration string
+    """
+    manager = _worker_manager
+    return manager._generate(
+        node_name, manager.output_dir / node_name / "bird.conf",
+        generated_at, use_cache=True, digest=digest,
+    )
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -371,20 +901,21 @@ Examples:
 
             if args.validate:
                 print("\nValidating configurations...")
-                for node_name, config in configs.items():
-                    print(f"\nValidating {node_name}:")
-                    manager.validate_config(config)
+                manager.validate_configs(configs)
 
         elif args.node:
             # Generate for single node
             output_path = Path(args.output) if args.output and not args.dry_run else None
-            config = manager.generate(args.node, output_path)
+
+            # Writing to a file with nothing else reading the text: stream it
+            stream = output_path is not None and not args.validate
+            config = manager.generate(args.node, output_path, return_config=not stream)
 
             if args.dry_run or not args.output:
                 print(config)
 
             if args.validate:
-                manager.validate_config(config)
+                manager.validate_config(config, args.node)
         else:
             parser.print_help()
             sys.exit(1)